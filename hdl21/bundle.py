@@ -109,7 +109,7 @@ class BundleInstance:
         self.props: Properties = Properties()
         # Connected port references
         self._connected_ports: Set["PortRef"] = set()
-        self._parent_module: Optional["Module"] = None
+        self._parent_module: Optional["weakref.ref"] = None  # Weak reference to the parent `Module`
         self._elaborated = False
         self._initialized = True
 
@@ -26,6 +26,8 @@ class Concat:
             raise TypeError(f"Invalid `Concat` of {invalid_parts}")
 
         for part in parts:
+            if part._concats is None:  # Lazily created by some types, e.g. `Slice`
+                part._concats = set()
             part._concats.add(self)
 
         # Store the `parts` to a tuple
@@ -3,7 +3,7 @@
 """
 
 # Local imports
-from ...module import Module
+from ...module import Module, _pop_attr
 from ...instance import Instance
 from ...portref import PortRef
 from ...bundle import BundleInstance
@@ -26,9 +26,8 @@ class ArrayFlattener(ElabPass):
 
         # Flatten Instance arrays
         while module.instarrays:
-            name, array = module.instarrays.popitem()
+            name, array = _pop_attr(module, "instarrays")
             self.stack.append(array)
-            module.namespace.pop(name)
 
             # Visit the array's target
             target = self.elaborate_instance_base(array)
@@ -9,7 +9,7 @@ from typing import Dict, List, Union, Optional
 
 # Local imports
 from ...datatype import datatype, AllowArbConfig
-from ...module import Module
+from ...module import Module, _pop_attr
 from ...instance import Instance
 from ... import Slice, Concat, NoConn, PortRef
 from ...bundle import (
@@ -142,8 +142,7 @@ class BundleFlattener(ElabPass):
 
         # Remove and replace each `BundleInstance` from the Module
         while module.bundles:
-            name, bundle_inst = module.bundles.popitem()
-            module.namespace.pop(name)
+            name, bundle_inst = _pop_attr(module, "bundles")
             self.replace_bundle_inst(module, bundle_inst)
 
         # Go through each Instance, replacing `AnonymousBundle`s with their referents
@@ -16,7 +16,7 @@ FIXME: sort out the relationship between this pass and `ConnTypes`.
 # Local imports
 from ...connect import is_connectable
 from ...bundle import AnonymousBundle, BundleInstance, _bundle_ref
-from ...module import Module
+from ...module import Module, _pop_attr
 from ...instance import Instance, InstanceBundle
 
 # Import the base class
@@ -33,8 +33,7 @@ class InstBundleElabPass(ElabPass):
         Remove each Instance Bundle, and replace it with "scalar" Instances."""
 
         while module.instbundles:
-            name, inst = module.instbundles.popitem()
-            module.namespace.pop(name)
+            name, inst = _pop_attr(module, "instbundles")
             self.elaborate_instance_bundle(module, inst)
 
         return module
@@ -3,7 +3,7 @@
 """
 
 # Local imports
-from ...module import Module, ModuleAttr
+from ...module import Module, ModuleAttr, _get_parent_module
 from ...instance import _Instance
 
 # Import the base class
@@ -38,9 +38,9 @@ class Orphanage(ElabPass):
     Here the dictionary `my_favorite_signals` retains a reference to Signal `s`.
     This does not generate an orphan-error complaint, so long as `Module`-parent is unique and unambiguous.
 
-    The orphan-test is very simple: each Module-attribute is annotated with a `_parent_module` member
-    upon insertion into the Module namespace.
-    Orphan-testing simply requires that for each attribute, this member is identical to the parent Module.
+    The orphan-test is very simple: each Module-attribute is annotated with a `_parent_module` member,
+    a weak reference to the Module, upon insertion into the Module namespace.
+    Orphan-testing simply requires that for each attribute, this member refers to the parent Module.
     A `RuntimeError` is raised if orphaned attributes are detected.
     Otherwise each Module is returned unchanged.
     """
@@ -125,11 +125,12 @@ class Orphanage(ElabPass):
     def assert_parentage(self, module: Module, attr: ModuleAttr) -> None:
         """Assert that `attr` is parented by `module`, or fail."""
 
-        if attr._parent_module is None:
+        parent = _get_parent_module(attr)
+        if parent is None:
             msg = f"Orphanage! Module `{module.name}` depends on orphan attribute `{attr}`! "
             msg += "Did you forget to `add()` or assign it into `{module.name}`? "
             self.fail(msg)
 
-        if attr._parent_module is not module:
-            msg = f"Orphanage: Module {module} attribute {attr} is actually owned by another Module {attr._parent_module}!"
+        if parent is not module:
+            msg = f"Orphanage: Module {module} attribute {attr} is actually owned by another Module {parent}!"
             self.fail(msg)
@@ -4,7 +4,7 @@
 Wrapper for circuits defined outside Hdl21. 
 """
 
-from typing import Any, Optional, List, Type, Dict
+from typing import Any, Optional, List, Type, Dict, Tuple
 from pydantic.dataclasses import dataclass
 
 # VLSIR Imports
@@ -15,12 +15,12 @@ from .datatype import datatype
 from .default import Default
 from .call import param_call
 from .source_info import source_info, SourceInfo
-from .params import HasNoParams, isparamclass, _unique_name
+from .params import HasNoParams, NoParams, isparamclass, _unique_name
 from .signal import Signal, Visibility
 from .instance import calls_instantiate
 
 
-@datatype
+@datatype(eq=False)  # Identity is equality, via `object`'s `__eq__` and `__hash__`
 class ExternalModule:
     """
     # External Module
@@ -45,8 +45,9 @@ class ExternalModule:
 
     @property
     def ports(self) -> dict:
-        """Port dictionary, from name to `Signal`."""
-        return {p.name: p for p in self.port_list}
+        """Port dictionary, from name to `Signal`.
+        Computed once from `port_list` at construction time, which therefore must not be modified afterwards."""
+        return self._ports
 
     @property
     def Params(self) -> Type:
@@ -65,6 +66,7 @@ class ExternalModule:
         # Internal tracking data: defining module/import-path
         self._source_info: Optional[SourceInfo] = source_info(get_pymodule=True)
         self._importpath = None
+        self._qualname_cache: Optional[Tuple[str, Optional[List[str]], str]] = None  # Cached `(name, importpath, qualname)`
 
         # Now do some more checks on values
         for p in self.port_list:
@@ -74,21 +76,25 @@ class ExternalModule:
                 msg = f"Invalid Primitive Port {p.name} on {self.name}; must have PORT visibility"
                 raise ValueError(msg)
 
+        # And create our port dictionary, from name to `Signal`
+        self._ports: Dict[str, Signal] = {p.name: p for p in self.port_list}
+
     def __call__(self, arg: Any = Default, **kwargs) -> "ExternalModuleCall":
         """Call to set an `ExternalModule`'s parameters.
         Returns an `ExternalModuleCall` combining the `ExternalModule` and parameter values.
         """
+        # Fast paths for the most common calls, which skip the argument-handling of `param_call`.
+        if arg is Default:
+            if self.paramtype is HasNoParams and not kwargs:
+                # Parameter-less, e.g. `MyExtMod()(a=a)`. Use the shared `NoParams` instance.
+                return ExternalModuleCall(module=self, params=NoParams)
+            if self.paramtype is dict:
+                # Dictionary-valued parameters. Our `kwargs` are already a fresh `dict`.
+                return ExternalModuleCall(module=self, params=kwargs)
+
         params = param_call(callee=self, arg=arg, **kwargs)
         return ExternalModuleCall(module=self, params=params)
 
-    def __eq__(self, other) -> bool:
-        # Identity is equality
-        return other is self
-
-    def __hash__(self) -> bool:
-        # Identity is equality
-        return hash(id(self))
-
 
 @calls_instantiate
 @dataclass
@@ -8,7 +8,7 @@ Including facilities for embedding them in a hardware hierarchy.
 # Std-Lib imports
 import inspect
 from dataclasses import field
-from typing import Callable, Any, Optional, Dict, Set, List, Type
+from typing import Callable, Any, Optional, Dict, Set, List, Tuple, Type
 
 # Local imports
 from .datatype import datatype, AllowArbConfig
@@ -41,6 +41,7 @@ class Generator:
                 f"Invalid paramtype {self.paramtype} for Generator {self.func}"
             )
         self._source_info: Optional[SourceInfo] = source_info(get_pymodule=True)
+        self._qualname_cache: Optional[Tuple[str, Optional[List[str]], str]] = None  # Cached `(name, importpath, qualname)`
 
     def __call__(self, arg: Any = Default, **kwargs: Dict) -> Module:
         params = param_call(callee=self, arg=arg, **kwargs)
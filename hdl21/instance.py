@@ -41,7 +41,7 @@ class _Instance:
         # References we give out, either for refering to ports or entries in out own `conns`
         self._refs = Refs()
 
-        self._parent_module: Optional["Module"] = None  # Instantiating module
+        self._parent_module: Optional["weakref.ref"] = None  # Weak reference to the instantiating `Module`
         self._elaborated: bool = False
         self._source_info: Optional[SourceInfo] = source_info(get_pymodule=False)
 
@@ -261,8 +261,11 @@ def _to_array(inst: Instance, num: int) -> InstanceArray:
     if len(inst._refs.portrefs) > 0:
         msg = f"Cannot convert Instance {inst} with outstanding port-references {inst._portrefs} to Array"
         raise RuntimeError(msg)
-    if inst._parent_module is not None:
-        msg = f"Cannot convert Instance {inst} already inserted in Module {inst._parent_module} to Array"
+    from .module import _get_parent_module
+
+    parent = _get_parent_module(inst)
+    if parent is not None:
+        msg = f"Cannot convert Instance {inst} already inserted in Module {parent} to Array"
         raise RuntimeError(msg)
 
     # Checks out. Create the array.
@@ -7,8 +7,10 @@ This module primarily defines:
 * The `@module` (lower-case) decorator-function, for class-syntax creation of `Module`s
 """
 
+import sys
+import weakref
 from inspect import isclass
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Optional, Union, List, Dict, Set, Tuple
 
 # Local imports
 from .source_info import source_info, SourceInfo
@@ -16,6 +18,7 @@ from .attrmagic import init
 from .signal import Signal, Visibility
 from .instance import (
     calls_instantiate,
+    _Instance,
     Instance,
     InstanceArray,
     InstanceBundle,
@@ -57,8 +60,31 @@ class Module:
 
     Hdl21 Modules *do not* contain behavior in the sense of procedural HDLs. Nor do they contain parameters.
     Parametric hardware is produced through Hdl21's `generator` facility, which defines python functions which create and return `Module`s.
+
+    Module identity is equality, via `object`'s `__eq__` and `__hash__`.
     """
 
+    # Fixed attribute-slots. Modules are commonly created in large numbers.
+    # All internal attributes are slots, leaving the instance `__dict__` to serve solely as the HDL `namespace`.
+    # Any other non-HDL attributes, e.g. those set by user code, are stored in the `_extra` dict.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "name",
+        "literals",
+        "props",
+        "_elaborated",
+        "_pre_flattening_io",
+        "_generated_by",
+        "_importpath",
+        "_source_info",
+        "_qualname_cache",
+        "_typed_views",
+        "_port_names",
+        "_extra",
+        "_initialized",
+    )
+
     def __init__(self, name: Optional[str] = None):
         if name is not None and not isinstance(name, str):
             # Something wrong with this `name`.
@@ -70,13 +96,11 @@ class Module:
             raise TypeError(msg)
         self.name = name
 
-        self.ports: Dict[str, Signal] = dict()
-        self.signals: Dict[str, Signal] = dict()
-        self.instances: Dict[str, Instance] = dict()
-        self.instarrays: Dict[str, InstanceArray] = dict()
-        self.instbundles: Dict[str, InstanceBundle] = dict()
-        self.bundles: Dict[str, BundleInstance] = dict()
-        self.namespace: Dict[str, ModuleAttr] = dict()  # Combination of all these
+        # Type-based views of our namespace, e.g. `ports` and `instances`.
+        # Built upon first access, and updated in place as attributes are added and removed.
+        self._typed_views: Optional[Dict[str, Dict[str, ModuleAttr]]] = None
+        # Names of port-visible Signals, classified as of their addition
+        self._port_names: Set[str] = set()
 
         self.literals: List[Literal] = list()
         self.props: Properties = Properties()
@@ -96,6 +120,8 @@ class Module:
 
         self._importpath = None  # Optional field set by importers
         self._source_info: Optional[SourceInfo] = source_info(get_pymodule=True)
+        self._qualname_cache: Optional[Tuple[str, Optional[List[str]], str]] = None  # Cached `(name, importpath, qualname)`
+        self._extra: Optional[Dict[str, Any]] = None  # Other non-HDL attributes. Created on first use.
         self._initialized = True
 
     """
@@ -135,26 +161,67 @@ class Module:
 
         # Now sort out naming. We get two name-sources:
         # (a) the function-argument `name` and (b) the value's `name` attribute.
-        # One or the other (and not both) must be set.
-        if name is None and val.name is None:  # Neither set, fail.
-            msg = f"Anonymous attribute {val} cannot be added to Module {self.name}"
-            raise RuntimeError(msg)
-        if name is not None and val.name is not None:  # Both set, fail.
+        # One or the other (and not both) must be set, which the common, successful case checks in a single comparison.
+        if (name is None) == (val.name is None):
+            if name is None:  # Neither set, fail.
+                msg = f"Anonymous attribute {val} cannot be added to Module {self.name}"
+                raise RuntimeError(msg)
+            # Both set, fail.
             msg = f"{val} with conflicting names {name} and {val.name} cannot be added to Module {self.name}"
             raise RuntimeError(msg)
         if name is not None:  # One or the other set - great.
             val.name = name
 
         # Now `val.name` is set appropriately.
-        # Add it to our type-based containers, and return it.
+        # Add it to our namespace, and return it.
         return _add(module=self, val=val)
 
     def get(self, name: str) -> Optional[ModuleAttr]:
         """Get module-attribute `name`. Returns `None` if not present.
         Note unlike Python built-ins such as `getattr`, `get` returns solely
-        from the HDL namespace-worth of `ModuleAttr`s."""
-        ns = self.__getattribute__("namespace")
-        return ns.get(name, None)
+        from the HDL namespace-worth of `ModuleAttr`s.
+        This is a single lookup into our namespace dictionary, which is cheap enough to require no further caching."""
+        return self.__dict__.get(name)
+
+    @property
+    def namespace(self) -> Dict[str, ModuleAttr]:
+        """The HDL namespace, from which all of our type-based views are derived.
+        Stored as our instance `__dict__`, so that dot-access to HDL attributes is "regular" attribute-access."""
+        return self.__dict__
+
+    """
+    Type-based views of the namespace
+    """
+
+    @property
+    def ports(self) -> Dict[str, Signal]:
+        """Port-visible Signals"""
+        return _get_typed_views(self)["ports"]
+
+    @property
+    def signals(self) -> Dict[str, Signal]:
+        """Internal (non-port) Signals"""
+        return _get_typed_views(self)["signals"]
+
+    @property
+    def instances(self) -> Dict[str, Instance]:
+        """Instances"""
+        return _get_typed_views(self)["instances"]
+
+    @property
+    def instarrays(self) -> Dict[str, InstanceArray]:
+        """Instance Arrays"""
+        return _get_typed_views(self)["instarrays"]
+
+    @property
+    def instbundles(self) -> Dict[str, InstanceBundle]:
+        """Instance Bundles"""
+        return _get_typed_views(self)["instbundles"]
+
+    @property
+    def bundles(self) -> Dict[str, BundleInstance]:
+        """Bundle Instances"""
+        return _get_typed_views(self)["bundles"]
 
     @property
     def bundle_ports(self) -> dict:
@@ -167,11 +234,20 @@ class Module:
     """
 
     def __setattr__(self, key: str, val: Any) -> None:
-        """Set-attribute over-ride, organizing into type-based containers"""
+        """Set-attribute over-ride, adding HDL attributes to our namespace"""
 
         if key.startswith("_") or not getattr(self, "_initialized", False):
             # Bootstrapping phase. Pass along to "regular" setattr.
-            return super().__setattr__(key, val)
+            if key in _slots:
+                return super().__setattr__(key, val)
+            # Our instance `__dict__` is reserved for the HDL namespace.
+            # Store anything else in our `_extra` dict.
+            extra = getattr(self, "_extra", None)
+            if extra is None:
+                extra = dict()
+                super().__setattr__("_extra", extra)
+            extra[key] = val
+            return None
 
         if key in _banned:
             msg = f"Error attempting to over-write protected attribute {key} of Module {self}"
@@ -183,19 +259,22 @@ class Module:
         # Check it's a valid attribute-type
         _assert_module_attr(self, val)
 
-        # Checks out! Name `val` and add it to our type-based containers.
+        # Checks out! Name `val` and add it to our namespace.
         val.name = key
         _add(module=self, val=val)
         return None
 
     def __getattr__(self, key: str) -> Any:
-        """Include our namespace-worth of HDL objects in dot-access retrievals"""
-        if key.startswith("_"):
-            return object.__getattribute__(self, key)
-        ns = self.__getattribute__("namespace")
-        if key in ns:
-            return ns[key]
-        return object.__getattribute__(self, key)
+        """Get-attribute fallback, called only when regular lookup fails.
+        Checks our non-HDL `_extra` attributes."""
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None  # Not yet set, during construction
+        if extra is not None and key in extra:
+            return extra[key]
+        msg = f"{type(self).__name__!r} object has no attribute {key!r}"
+        raise AttributeError(msg)
 
     def __delattr__(self, __name: str) -> None:
         """Disable attribute deletion.
@@ -214,14 +293,6 @@ class Module:
             return f"Module(name={self.name})"
         return f"Module(_anon_)"
 
-    def __eq__(self, other) -> bool:
-        # Identity is equality
-        return other is self
-
-    def __hash__(self) -> bool:
-        # Identity is equality
-        return hash(id(self))
-
 
 def module(cls: type) -> Module:
     """
@@ -269,19 +340,23 @@ def module(cls: type) -> Module:
     # Create the Module object
     module = Module(name=cls.__name__)
 
-    # Any class-body content that isn't a `ModuleAttr` will be "forgotten" from the `Module` definition.
+    # Any class-body content that isn't a `ModuleAttr`, or is underscore-prefixed, will be "forgotten" from the `Module` definition.
     # This can nonetheless be handy for defining intermediate values upon which the ultimate Module attributes depend.
     forgetme: List[Any] = list()
 
-    # Take a lap through the class dictionary, type-check everything and assign relevant attributes to the bundle
+    # Take a lap through the class dictionary, type-check everything and collect the relevant attributes
+    attrs: List[Tuple[str, ModuleAttr]] = list()
     for key, val in cls.__dict__.items():
         if key in _banned:
             raise RuntimeError(f"Invalid field name {key} in Module {module.name}")
-        elif _is_module_attr(val):
-            setattr(module, key, val)
+        elif not key.startswith("_") and _is_module_attr(val):
+            attrs.append((key, val))
         else:  # Add to the forget-list
             forgetme.append(val)
 
+    # Add them all to the Module in a single batch
+    _add_many(module, attrs)
+
     # And return the Module
     return module
 
@@ -293,77 +368,175 @@ Many of which could be methods, but are generally kept here to prevent expanding
 """
 
 
+# Internal, non-HDL attribute names, all stored in `Module.__slots__`
+_slots = frozenset(Module.__slots__)
+
 # Protected Module attribute names
-_banned = [
-    "ports",
-    "signals",
-    "instances",
-    "instarrays",
-    "instbundles",
-    "bundles",
-    "literals",
-    "props",
-    "namespace",
-    "add",
-    "get",
-]
+_banned = frozenset(
+    {
+        "ports",
+        "signals",
+        "instances",
+        "instarrays",
+        "instbundles",
+        "bundles",
+        "literals",
+        "props",
+        "namespace",
+        "add",
+        "get",
+    }
+)
 
 
 def _add(module: Module, val: ModuleAttr) -> ModuleAttr:
     """Internal `Module.add` and `Module.__setattr__` implementation.
-    Primarily sort `val` into one of our type-based containers.
+    Primarily add `val` to the module namespace, from which our type-based views are derived.
     Layers above `_add` must ensure that `val` has its `name` attribute before calling this method.
     """
 
     if module._elaborated is not None:
         raise RuntimeError(f"Cannot add {val} to {module} after elaboration.")
+    if val.name in _banned:
+        # Checked here as well as in `__setattr__`, as `Module.add` can name things otherwise.
+        # Adding these to the namespace would shadow the `Module` methods and containers of the same names.
+        msg = f"Error attempting to over-write protected attribute {val.name} of Module {module}"
+        raise RuntimeError(msg)
 
-    # Sort out which of our type-based containers to add `val` to.
-    if isinstance(val, Signal):
-        if val.vis == Visibility.PORT:
-            type_ctr = module.ports
-        else:
-            type_ctr = module.signals
-    elif isinstance(val, Instance):
-        type_ctr = module.instances
-    elif isinstance(val, InstanceArray):
-        type_ctr = module.instarrays
-    elif isinstance(val, InstanceBundle):
-        type_ctr = module.instbundles
-    elif isinstance(val, BundleInstance):
-        type_ctr = module.bundles
-    else:
-        # The next line *should* never be reached, as outer layers should have checked `_is_module_attr`.
-        # Nonetheless gotta raise an error if we get here, somehow.
-        _attr_type_error(val)
+    # Intern its name. Common names such as "vdd" and "clk" recur across many modules,
+    # and are commonly generated programmatically, e.g. via f-strings, rather than as (already interned) literals.
+    # Interning lets namespace lookups, e.g. via dot-access or `Module.get`, hit on a pointer comparison.
+    if type(val.name) is str:
+        val.name = sys.intern(val.name)
 
-    # Add it to the module namespace, and the type-specific container
-    type_ctr[val.name] = val
-    module.namespace[val.name] = val
+    name = val.name
+
+    # Signals are classified as ports by their visibility as of being added.
+    if isinstance(val, Signal) and val.vis == Visibility.PORT:
+        module._port_names.add(name)
+    else:
+        module._port_names.discard(name)
+
+    # Sort out which of our type-based views `val` belongs to.
+    view = _view_name(module, val)
+
+    # Add it to the module namespace.
+    # The namespace is the module's instance `__dict__`, making `val` available via regular dot-access.
+    # Replacing an existing attribute keeps its position, and hence e.g. port order.
+    replaced = name in module.__dict__
+    module.__dict__[name] = val
+
+    # And if our type-based views have been built, update them in place
+    views = module._typed_views
+    if views is not None:
+        if replaced and name not in views[view]:
+            # Replaced an attribute of another view. Re-build them upon next access, to keep namespace order.
+            module._typed_views = None
+        else:
+            views[view][name] = val
 
     # Give it a reference to us.
     #
     # ## Note:
     # Parent-testing *can* be done here instead of at elaboration time.
     # It's not clear that this would be a good idea though.
-    # Attributes which are *copied* (for example) keep the `_parent_module` member, which is often helpful to just over-write.
+    # Attributes which are *copied* (for example) keep the `_parent_module` weak reference, which is often helpful to just over-write.
     # Nonetheless if "setattr-time" failure is desired, this is where it will go:
     #
-    # _parent = getattr(val, "_parent_module", None) # Note many attributes will not have this member, until this assignment.
+    # _parent = _get_parent_module(val)
     # if _parent is not None and _parent is not module:
-    #     msg = f"{val.name} being added to {module} already has a parent-module {val._parent_module}"
+    #     msg = f"{val.name} being added to {module} already has a parent-module {_parent}"
     #     raise RuntimeError(msg)
     #
-    # Ok, now actually give it a reference to us:
-    val._parent_module = module
+    # Ok, now actually give it a reference to us.
+    # The reference is weak, so that the module and its attributes do not form reference cycles.
+    val._parent_module = weakref.ref(module)
 
     # And return our newly-added attribute
     return val
 
 
+def _add_many(module: Module, attrs: List[Tuple[str, ModuleAttr]]) -> None:
+    """Add a batch of `(name, attr)` pairs to `module`.
+    Skips the per-attribute dispatch and checks of `Module.__setattr__`.
+    Callers must ensure that each `attr` is a valid `ModuleAttr`, and that each `name` is a valid HDL attribute-name."""
+    for name, val in attrs:
+        val.name = name
+        _add(module=module, val=val)
+
+
+def _get_parent_module(val: ModuleAttr) -> Optional[Module]:
+    """Get the parent `Module` of attribute `val`, or `None` if it has none.
+    Dereferences the weak `_parent_module` reference set by `_add`."""
+    ref = getattr(val, "_parent_module", None)
+    if ref is None:
+        return None
+    return ref()
+
+
+# Names of the type-based views of each non-`Signal` `ModuleAttr` type.
+# Signals are split between "ports" and "signals" by `_view_name`.
+_type_views = {
+    Instance: "instances",
+    InstanceArray: "instarrays",
+    InstanceBundle: "instbundles",
+    BundleInstance: "bundles",
+}
+
+# Names of all type-based views
+_view_names = ("ports", "signals", "instances", "instarrays", "instbundles", "bundles")
+
+
+def _view_name(module: Module, val: ModuleAttr) -> str:
+    """Get the name of the type-based view of `module` which includes `val`, e.g. "ports" or "instances".
+    Signals are ports if they were port-visible as of being added to `module`."""
+    if isinstance(val, Signal):
+        if val.name in module._port_names:
+            return "ports"
+        return "signals"
+    view = _type_views.get(type(val), None)
+    if view is not None:
+        return view
+    for tp, view in _type_views.items():
+        if isinstance(val, tp):
+            return view
+    # The next line *should* never be reached, as outer layers should have checked `_is_module_attr`.
+    # Nonetheless gotta raise an error if we get here, somehow.
+    _attr_type_error(module, val)
+
+
+def _get_typed_views(module: Module) -> Dict[str, Dict[str, ModuleAttr]]:
+    """Get the type-based views of `module`'s namespace, building them if necessary.
+    Each is a dictionary in namespace order, keyed by view-name, e.g. "ports" or "instances"."""
+    views = module._typed_views
+    if views is not None:
+        return views
+    views = {name: dict() for name in _view_names}
+    for name, val in module.__dict__.items():
+        views[_view_name(module, val)][name] = val
+    module._typed_views = views
+    return views
+
+
+def _pop_attr(module: Module, view: str) -> Tuple[str, ModuleAttr]:
+    """Remove and return the last `(name, attr)` pair from `module`'s type-based view `view`, e.g. "instarrays",
+    and from its namespace. Used by elaboration passes which replace each attribute of a type, while adding others."""
+    name, val = _get_typed_views(module)[view].popitem()
+    del module.__dict__[name]
+    module._port_names.discard(name)
+    return name, val
+
+
+# Base types of the `ModuleAttr` union, for `isinstance` checks.
+# Bound at import time, and collapsing the three instance-types into their common base class.
+_module_attr_types = (Signal, _Instance, BundleInstance)
+
+
 def _is_module_attr(val: Any) -> bool:
     """Boolean indication of whether `val` is a valid `hdl21.Module` attribute."""
-    return isinstance(val, ModuleAttr.__args__)
+    # Exact-type checks cover the common cases. Sub-types fall back to `isinstance`.
+    tp = type(val)
+    return tp is Signal or tp in _type_views or isinstance(val, _module_attr_types)
 
 
 def _assert_module_attr(m: Module, val: Any) -> None:
@@ -372,20 +545,33 @@ def _assert_module_attr(m: Module, val: Any) -> None:
         _attr_type_error(m, val)
 
 
+# Types commonly confused with `ModuleAttr`s, as `(uncalled_types, call_types)`.
+# Imported and set upon first use by `_attr_type_error`, as these modules import this one.
+_confusable_types = None
+
+
 def _attr_type_error(m: Module, val: Any) -> None:
     """Raise a `TypeError` with debug info for invalid attribute `val`."""
 
     # Give more specific error-messages for our common types.
     # Especially those that are easily confused, e.g. all the `Call` types, `Module`s, and `Instance`s thereof.
-    from .external_module import ExternalModule, ExternalModuleCall
-    from .generator import Generator, GeneratorCall
-    from .primitives import Primitive, PrimitiveCall
-
-    if isinstance(val, (Generator, Primitive, ExternalModule)):
+    global _confusable_types
+    if _confusable_types is None:
+        from .external_module import ExternalModule, ExternalModuleCall
+        from .generator import Generator, GeneratorCall
+        from .primitives import Primitive, PrimitiveCall
+
+        _confusable_types = (
+            (Generator, Primitive, ExternalModule),
+            (GeneratorCall, PrimitiveCall, ExternalModuleCall),
+        )
+    uncalled_types, call_types = _confusable_types
+
+    if isinstance(val, uncalled_types):
         msg = f"Cannot add `{type(val).__name__}` `{val.name}` to `Module` `{m.name}`. Did you mean to make an `Instance` by *calling* it - once for params and once for connections - first?"
     elif isinstance(val, Module):
         msg = f"Cannot add `{type(val).__name__}` `{val.name}` to `Module` `{m.name}`. Did you mean to make an `Instance` by *calling* to connect it first?"
-    elif isinstance(val, (GeneratorCall, PrimitiveCall, ExternalModuleCall)):
+    elif isinstance(val, call_types):
         msg = f"Cannot add `{type(val).__name__}` `{val}` to `Module` `{m.name}`. Did you mean to make an `Instance` by *calling* to connect it first?"
     else:
         msg = f"Invalid Module attribute {val} of type {type(val)} for {m}. Valid `Module` attributes are of types: {list(ModuleAttr.__args__)}"
@@ -42,7 +42,18 @@ def qualname(mod: HasQualPath) -> Optional[str]:
     If `mod` has a qualified path as determined by `qualpath`, returns it
     joined together by the Python-conventional path-separator "."."""
 
+    # Qualified names are requested repeatedly, e.g. for each reference during export and each parameter-naming.
+    # Cache them, along with the `name` and `_importpath` they were computed from, as both may be (re)set after construction.
+    importpath = getattr(mod, "_importpath", None)
+    cached = mod._qualname_cache
+    if cached is not None and cached[0] == mod.name and cached[1] == importpath:
+        return cached[2]
+
     qpath = qualpath(mod)
     if qpath is None:
         return None
-    return ".".join(qpath)
+    qname = ".".join(qpath)
+    # Copy the import path, so that in-place changes to it are also detected
+    importpath = None if importpath is None else list(importpath)
+    mod._qualname_cache = (mod.name, importpath, qname)
+    return qname
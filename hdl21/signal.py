@@ -109,7 +109,7 @@ class Signal:
     def __post_init__(self):
         if self.width < 1:
             raise ValueError(f"Signal {self.name} width must be positive")
-        self._parent_module: Optional["Module"] = None
+        self._parent_module: Optional["weakref.ref"] = None  # Weak reference to the parent `Module`
         self._slices: Set["Slice"] = set()
         self._concats: Set["Concat"] = set()
         self._connected_ports: Set["PortRef"] = set()
@@ -140,7 +140,7 @@ class Signal:
         """Signal copying implementation
         Keeps "public" fields such as name and width,
         while dropping "per-module" fields such as `_slices`."""
-        # Notably `_parent_module` *is not* copied.
+        # Notably `_parent_module`, a weak reference to the parent Module, *is not* copied.
         # It will generally be set when the copy is added to any new Module.
         return Signal(
             name=self.name,
@@ -265,5 +265,5 @@ def _copy_to_internal(sig: Signal) -> Signal:
     sig = copy(sig)
     sig.vis = Visibility.INTERNAL
     sig.direction = PortDir.NONE
-    sig._parent_module = None
+    sig._parent_module = None  # Clear the (weak) parent-Module reference, to be set when added to a new Module
     return sig
@@ -4,11 +4,11 @@
 References by numeric index into Signals and other Connectable types. 
 """
 
+from functools import lru_cache
 from typing import Optional, Union, Any, Set
-from weakref import WeakSet
 
 # Local imports
-from .datatype import datatype, AllowArbConfig
+from .datatype import datatype, AllowArbConfig, PYDANTIC_V2
 from .connect import connectable
 from .sliceable import sliceable, is_sliceable
 from .concat import concatable
@@ -17,7 +17,7 @@ from .concat import concatable
 @sliceable
 @concatable
 @connectable
-@datatype(config=AllowArbConfig)
+@datatype(config=AllowArbConfig, eq=False)  # Identity is equality, via `object`'s `__eq__` and `__hash__`
 class Slice:
     """
     # Slice
@@ -36,6 +36,18 @@ class Slice:
     eschewing adopting inclusive-endpoints and negative-indexing.
     """
 
+    if PYDANTIC_V2:
+        # Slices are created in large numbers, and are worth the `__slots__` savings.
+        # Pydantic 1.x dataclasses validate through the instance `__dict__`, and hence can't use them.
+        __slots__ = (
+            "parent",
+            "index",
+            "_connected_ports",
+            "_inner",
+            "_slices",
+            "_concats",
+        )
+
     # Parent Connectable.
     # Really of union-type `Sliceable`, which is more painful to type-check statically,
     # although the constructor does it procedurally.
@@ -48,8 +60,10 @@ class Slice:
             raise TypeError(f"{self.parent} is not Sliceable")
         self._connected_ports: Set["PortRef"] = set()
         self._inner: Optional[SliceInner] = None
-        self._slices: WeakSet[Slice] = set()
-        self._concats: WeakSet["Concat"] = set()
+        # Dependent slices and concatenations. Created lazily, upon first use,
+        # as these are only ever consulted for references, and most slices have neither.
+        self._slices: Optional[Set[Slice]] = None
+        self._concats: Optional[Set["Concat"]] = None
 
     @property
     def top(self) -> int:
@@ -70,19 +84,15 @@ class Slice:
     def __repr__(self):
         return f"Slice(parent={self.parent}, index={self.index})"
 
-    def __eq__(self, other) -> bool:
-        # Identity is equality
-        return other is self
-
-    def __hash__(self) -> bool:
-        # Identity is equality
-        return hash(id(self))
-
 
-@datatype
+@datatype(frozen=True)
 class SliceInner:
     """Inner, private, resolved attributes of a `Slice`.
-    Designed solely to be created by `_slice_inner` and stored as the `Slice._inner` field."""
+    Designed solely to be created by `_slice_inner` and stored as the `Slice._inner` field.
+    Frozen, as instances are shared between equal-shaped `Slice`s."""
+
+    if PYDANTIC_V2:  # See the `__slots__` note on `Slice`
+        __slots__ = ("top", "bot", "step", "width")
 
     top: int  # Top index (exclusive)
     bot: int  # Bottom index (inclusive)
@@ -91,69 +101,110 @@ class SliceInner:
 
 
 def _slice_inner(slize: Slice) -> SliceInner:
-    """Calculate the inner resolved fields for `slize`"""
+    """Calculate the inner resolved fields for `slize`.
+    Extracts the parent's width and the index fields, and hands them to the pure-integer
+    `_int_slice_inner` or `_range_slice_inner` to do the arithmetic."""
 
     parent = slize.parent
     index = slize.index
 
     if isinstance(index, int):
-        if index >= parent.width:
+        parent_width = parent.width
+        if index >= parent_width:
             raise ValueError(f"Out-of-bounds index {index} into {parent}")
-        if index < 0:
-            index += parent.width
-        return SliceInner(top=index + 1, bot=index, step=1, width=1)
+        return _int_slice_inner(parent_width, index)
 
     if isinstance(index, slice):
-        # Note these `slice` attributes are descriptor-things, and they get weird, fast.
-        # Extracting their three index fields the most-hardest way via `__getattribute__` seems to work cleanest.
-        start = slice.__getattribute__(index, "start")
-        stop = slice.__getattribute__(index, "stop")
-        step = slice.__getattribute__(index, "step")
-
-        step = 1 if step is None else step
-        if step == 0:
-            raise ValueError(f"slice step cannot be zero")
-        elif step < 0:
-            # Here `top` gets a "+1" since `start` is *inclusive*, while `bot` gets "+1" as `stop` is *exclusive*.
-            top = (
-                parent.width
-                if start is None
-                else start + 1
-                if start >= 0
-                else parent.width + start + 1
-            )
-            bot = (
-                0
-                if stop is None
-                else stop + 1
-                if stop >= 0
-                else parent.width + stop + 1
-            )
-            # Align bot with the step
-            bot += (top - bot) % abs(step)
-        else:
-            # Here `start` and `stop` match `top` and `bot`'s inclusive/exclusivity.
-            # No need to add any offsets.
-            top = (
-                parent.width
-                if stop is None
-                else stop
-                if stop >= 0
-                else parent.width + stop
-            )
-            bot = 0 if start is None else start if start >= 0 else parent.width + start
-            # Align top with the step
-            top -= (top - bot) % step
-
-        width = (top - bot) // step
-
-        # Create and return our Slice. More checks are done in its constructor.
-        return SliceInner(top=top, bot=bot, step=step, width=width)
+        start, stop, step = index.start, index.stop, index.step
+
+        # Only get the parent's width if the slice depends on it.
+        # Some parents, notably `BundleRef`s before bundle-flattening, do not yet have a valid `width`.
+        parent_width = parent.width if _needs_width(start, stop, step) else None
+        return _range_slice_inner(parent_width, start, stop, step)
 
     # Shouldn't be reachable, but blow up if we (somehow) get here.
     raise TypeError("Internal Error: Slice index should be an int or (python) slice")
 
 
+# Designs commonly slice the same shapes, e.g. `sig[0]` or `sig[0:8]`, many times over.
+# Both resolvers are therefore memoized on their (integer) arguments, sharing `SliceInner`s between equal-shaped `Slice`s.
+# The caches are bounded, so that they do not grow with design size.
+@lru_cache(maxsize=4096)
+def _int_slice_inner(parent_width: int, index: int) -> SliceInner:
+    """Resolve integer `index` into a parent of width `parent_width`.
+    Bounds-checking is the responsibility of the caller."""
+    if index < 0:
+        index += parent_width
+    return SliceInner(top=index + 1, bot=index, step=1, width=1)
+
+
+def _needs_width(start: Optional[int], stop: Optional[int], step: Optional[int]) -> bool:
+    """Boolean indication of whether resolving the (python) slice `start:stop:step` requires its parent's width.
+    True if its top-end is unspecified or negative, or if its bottom-end is negative."""
+    if step is not None and step < 0:
+        top, bot = start, stop
+    else:
+        top, bot = stop, start
+    return top is None or top < 0 or (bot is not None and bot < 0)
+
+
+@lru_cache(maxsize=4096)
+def _range_slice_inner(
+    parent_width: Optional[int],
+    start: Optional[int],
+    stop: Optional[int],
+    step: Optional[int],
+) -> SliceInner:
+    """Resolve the (python) slice `start:stop:step` into a parent of width `parent_width`.
+    `parent_width` may be `None` if `_needs_width` indicates it is not required."""
+
+    step = 1 if step is None else step
+    if step == 0:
+        raise ValueError(f"slice step cannot be zero")
+    elif step < 0:
+        # Here `top` gets a "+1" since `start` is *inclusive*, while `bot` gets "+1" as `stop` is *exclusive*.
+        if start is None:
+            top = parent_width
+        elif start >= 0:
+            top = start + 1
+        else:
+            top = parent_width + start + 1
+
+        if stop is None:
+            bot = 0
+        elif stop >= 0:
+            bot = stop + 1
+        else:
+            bot = parent_width + stop + 1
+
+        # Align bot with the step
+        bot += (top - bot) % -step
+    else:
+        # Here `start` and `stop` match `top` and `bot`'s inclusive/exclusivity.
+        # No need to add any offsets.
+        if stop is None:
+            top = parent_width
+        elif stop >= 0:
+            top = stop
+        else:
+            top = parent_width + stop
+
+        if start is None:
+            bot = 0
+        elif start >= 0:
+            bot = start
+        else:
+            bot = parent_width + start
+
+        # Align top with the step
+        top -= (top - bot) % step
+
+    width = (top - bot) // step
+
+    # Create and return our Slice. More checks are done in its constructor.
+    return SliceInner(top=top, bot=bot, step=step, width=width)
+
+
 def _get_inner(slice: Slice) -> SliceInner:
     """Get a slice's `SliceInner`, calculating it inline if necessary"""
     if slice._inner is None:
@@ -58,5 +58,7 @@ def _slice(*, parent: "Sliceable", index: Union[int, slice]) -> "Slice":
         raise TypeError
 
     slize = Slice(parent=parent, index=index)
+    if parent._slices is None:  # Lazily created by some types, e.g. `Slice`
+        parent._slices = set()
     parent._slices.add(slize)
     return slize
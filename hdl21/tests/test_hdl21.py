@@ -360,6 +360,26 @@ def test_signal_slice2():
     assert sl.width == 2
 
 
+def test_signal_slice_steps():
+    # Test slices with combinations of unspecified, negative, and stepped fields
+    s = h.Signal(width=8)
+
+    sl = s[:]
+    assert (sl.top, sl.bot, sl.step, sl.width) == (8, 0, 1, 8)
+
+    sl = s[1:7:2]
+    assert (sl.top, sl.bot, sl.step, sl.width) == (7, 1, 2, 3)
+
+    sl = s[-6::3]
+    assert (sl.top, sl.bot, sl.step, sl.width) == (8, 2, 3, 2)
+
+    sl = s[:-2:2]
+    assert (sl.top, sl.bot, sl.step, sl.width) == (6, 0, 2, 3)
+
+    with pytest.raises(ValueError):
+        s[::0].width
+
+
 @pytest.mark.xfail(reason="#21 https://github.com/dan-fritchman/Hdl21/issues/21")
 def test_bad_slice1():
     # Test slicing error-cases
@@ -657,6 +677,22 @@ def test_illegal_module_attrs():
     assert not hasattr(HasMethod, "fail")
 
 
+def test_module_decorator_private_attrs():
+    """Test that underscore-prefixed class-body attributes are "forgotten" by the `module` decorator."""
+
+    @h.module
+    class M:
+        _tmp = h.Signal(width=4)
+        s = h.Signal(width=_tmp.width)
+        p = h.Input()
+
+    assert list(M.namespace) == ["s", "p"]
+    assert M.s.width == 4
+    assert M.get("_tmp") is None
+    assert list(M.signals) == ["s"]
+    assert list(M.ports) == ["p"]
+
+
 def test_copy_signal():
     """Copying a Signal"""
     copy.copy(h.Signal())
@@ -1734,3 +1770,170 @@ def test_generator_caching():
     assert n3 is not n4
     assert n3 is not n2
     assert n3 is not n1
+
+
+def test_module_namespace():
+    """Test that HDL attributes are stored in, and retrieved from, the `Module` namespace."""
+
+    m = h.Module(name="m")
+    m.s = h.Signal()
+    inp = m.add(h.Input(name="in"))
+
+    assert m.s is m.get("s") is m.namespace["s"]
+    assert m.get("in") is inp
+    assert getattr(m, "in") is inp
+    assert list(m.namespace) == ["s", "in"]
+
+    with pytest.raises(AttributeError):
+        m.not_there
+
+    # Protected names cannot be added, via either `setattr` or `add`
+    with pytest.raises(RuntimeError):
+        m.add(h.Signal(name="add"))
+    with pytest.raises(RuntimeError):
+        m.get = h.Signal()
+
+    # Other non-HDL attributes are stored, but outside the namespace
+    m._not_internal = 5
+    assert m._not_internal == 5
+    assert "_not_internal" not in m.namespace
+    with pytest.raises(AttributeError):
+        m._not_set
+
+
+def test_qualname_cache():
+    """Test that cached qualified-names follow changes to `name` and `_importpath`."""
+    from hdl21.qualname import qualname
+
+    m = h.Module()
+    assert qualname(m) is None
+
+    m.name = "FirstName"
+    assert qualname(m) == __name__ + ".FirstName"
+    assert qualname(m) == __name__ + ".FirstName"
+
+    m.name = "SecondName"
+    assert qualname(m) == __name__ + ".SecondName"
+
+    m._importpath = ["imported", "path"]
+    assert qualname(m) == "imported.path.SecondName"
+    m._importpath.append("more")
+    assert qualname(m) == "imported.path.more.SecondName"
+
+
+def test_slice_inner_sharing():
+    """Test that equal-shaped `Slice`s share resolved inner data, but remain distinct objects."""
+    from hdl21.slice import _get_inner
+
+    a = h.Signal(width=8)
+    b = h.Signal(width=8)
+    sa, sb = a[1:5], b[1:5]
+    assert sa is not sb
+    assert sa != sb
+    assert _get_inner(sa) is _get_inner(sb)
+    assert (sa.top, sa.bot, sa.step, sa.width) == (5, 1, 1, 4)
+    assert _get_inner(a[-1]) is _get_inner(b[-1])
+
+    # Shared inner data is immutable
+    with pytest.raises(AttributeError):  # Specifically, `dataclasses.FrozenInstanceError`
+        _get_inner(sa).top = 99
+    assert b[1:5].top == 5
+
+
+def test_parent_module_weakref():
+    """Test that Module attributes refer weakly to their parent Module."""
+    from hdl21.module import _get_parent_module
+
+    m = h.Module(name="m")
+    s = m.add(h.Signal(name="s"))
+    assert _get_parent_module(s) is m
+    assert _get_parent_module(h.Signal()) is None
+
+    # Dropping the Module leaves `s` parent-less, without requiring a garbage-collection cycle
+    del m
+    assert _get_parent_module(s) is None
+
+    # Instances can be converted to arrays only while un-parented
+    @h.module
+    class Inner:
+        p = h.Port()
+
+    m = h.Module(name="m")
+    i = m.add(Inner(), name="i")
+    with pytest.raises(RuntimeError, match="Module Module\\(name=m\\)"):
+        2 * i
+    del m
+    assert isinstance(2 * i, h.InstanceArray)
+
+
+def test_module_typed_views():
+    """Test the type-based views of the `Module` namespace."""
+
+    @h.module
+    class Inner:
+        p = h.Port()
+
+    m = h.Module(name="m")
+    m.a = h.Input()
+    m.b = h.Signal()
+    m.i = Inner(p=m.b)
+    assert list(m.ports) == ["a"]
+    assert list(m.signals) == ["b"]
+    assert list(m.instances) == ["i"]
+    assert m.instarrays == m.instbundles == m.bundles == {}
+
+    # Views are updated as attributes are added
+    m.add(h.Output(name="c"))
+    m.d = h.Signal()
+    assert list(m.ports) == ["a", "c"]
+    assert list(m.signals) == ["b", "d"]
+    assert m.ports["c"] is m.c
+
+    # Signals are classified by their visibility as of being added.
+    # Later changes do not move them between views.
+    m.e = h.Signal()
+    m.e.vis = h.Visibility.PORT
+    m.f = h.Signal()
+    assert "e" in m.signals and "e" not in m.ports
+
+    # Replacing an attribute replaces it in the views too, keeping namespace order
+    m.e = h.Input()
+    assert "e" in m.ports and "e" not in m.signals
+    assert list(m.ports) == ["a", "c", "e"]
+    m.a = h.Input(width=2)
+    assert list(m.ports) == ["a", "c", "e"]
+    assert m.ports["a"] is m.a
+
+
+def test_module_typed_views_many():
+    """Test elaborating a Module with many arrays and bundles,
+    each of which is replaced during elaboration, and which should not re-build the type-based views."""
+
+    @h.bundle
+    class B:
+        x = h.Signal()
+
+    @h.module
+    class Inv:
+        i = h.Input()
+
+    N = 1000
+    m = h.Module(name="many")
+    for k in range(N):
+        s = m.add(h.Signal(name=f"s{k}"))
+        m.add(B(), name=f"b{k}")
+        m.add(2 * Inv(i=s), name=f"a{k}")
+
+    # Once built, the views are updated in place rather than re-built
+    assert len(m.instarrays) == len(m.bundles) == N
+    views = m._typed_views
+    assert views is not None
+    m.add(h.Signal(name="extra"))
+    assert m._typed_views is views
+
+    h.elaborate(m)
+    assert m._typed_views is views
+    assert m.instarrays == m.bundles == {}
+    assert len(m.instances) == 2 * N
+    assert len(m.signals) == 2 * N + 1
+    assert all(name in m.namespace for name in m.instances)